@@ -1 +1,6 @@
 from .hotkey_picker import HotkeyPicker
+from .keymap_sync import KeymapSync
+from .profile_manager import ProfileManager
+from .free_key_index import FreeKeyIndex
+from .hotkey_usage_tracker import HotkeyUsageTracker
+from .hotkey_picker_loader import HotkeyPickerLoader, HotkeyPickerPlaceholder
@@ -0,0 +1,202 @@
+from array import array
+from qtpy.QtCore import Qt
+from .hotkey_picker import HotkeyPicker
+from .key_index import KeyIndex, PickerKeyTracker
+
+
+class FreeKeyIndex(PickerKeyTracker):
+
+    # Keyboard rows (US layout), keys in the same row are suggested first ordered by distance
+    __rows = [
+        ['Escape'] + ['F{}'.format(i) for i in range(1, 13)],
+        ['QuoteLeft', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', 'Minus', 'Equal', 'Backspace'],
+        ['Tab', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', 'BracketLeft', 'BracketRight', 'Backslash'],
+        ['CapsLock', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Semicolon', 'Apostrophe', 'Return'],
+        ['Shift', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', 'Comma', 'Period', 'Slash'],
+        ['Control', 'Meta', 'Alt', 'Space', 'AltGr'],
+        ['Insert', 'Home', 'PageUp', 'Delete', 'End', 'PageDown'],
+        ['Left', 'Up', 'Down', 'Right']
+    ]
+
+    # Key categories, keys in the same category are suggested after the keys in the same row
+    __categories = [
+        [chr(c) for c in range(ord('A'), ord('Z') + 1)],
+        [str(i) for i in range(10)],
+        ['F{}'.format(i) for i in range(1, 36)],
+        ['Left', 'Up', 'Down', 'Right', 'Insert', 'Home', 'PageUp', 'Delete', 'End', 'PageDown'],
+        ['Shift', 'Control', 'Meta', 'Alt', 'AltGr', 'CapsLock'],
+        ['Escape', 'Tab', 'Backspace', 'Return', 'Enter', 'Space'],
+        ['QuoteLeft', 'Minus', 'Equal', 'BracketLeft', 'BracketRight', 'Backslash',
+         'Semicolon', 'Apostrophe', 'Comma', 'Period', 'Slash']
+    ]
+
+    # Rows and categories as dense key indices (unknown keys are dropped)
+    __groups = [[KeyIndex.getIndex(getattr(Qt.Key, 'Key_' + name, None)) for name in group]
+                for group in __rows + __categories]
+    __groups = [[index for index in group if index is not None] for group in __groups]
+
+    # Keys that are suggested when no closer key is free (regular keyboard keys, no media or unknown keys)
+    __suggested_keys = list(dict.fromkeys(index for group in __groups for index in group))
+
+    def __init__(self, parent=None):
+        """Create a new FreeKeyIndex instance
+
+        :param parent: the parent object
+        """
+
+        super(FreeKeyIndex, self).__init__(parent)
+
+        # Init variables
+        key_count = KeyIndex.getKeyCount()
+        self.__used = bytearray((key_count + 7) // 8)
+        self.__candidates = {}
+        self.__picker_candidates = {}
+
+    def removePicker(self, picker: HotkeyPicker):
+        """Stop tracking the hotkey of a hotkey picker
+
+        :param picker: the hotkey picker
+        """
+
+        super(FreeKeyIndex, self).removePicker(picker)
+        self.__picker_candidates.pop(picker, None)
+
+    def isKeyUsed(self, key: Qt.Key | int) -> bool:
+        """Get whether a key is the hotkey of any tracked picker
+
+        :param key: the key (e.g. 65 or Qt.Key.Key_A)
+        :return: whether the key is used
+        """
+
+        index = KeyIndex.getIndex(key)
+        return index is not None and self.__is_used(index)
+
+    def getUsedKeys(self) -> list[int]:
+        """Get all keys that are the hotkey of any tracked picker
+
+        :return: list of key codes
+        """
+
+        return [KeyIndex.getKey(index) for index in range(KeyIndex.getKeyCount()) if self.__is_used(index)]
+
+    def getFreeKeys(self, key: Qt.Key | int, picker: HotkeyPicker = None, limit: int = 5) -> list[int]:
+        """Get the closest keys to a key that are not used by any tracked picker
+
+        Keys in the same keyboard row are returned first, followed by keys in the same category
+        (e.g. letters or function keys) and all other regular keyboard keys.
+
+        :param key: the key that was requested (e.g. 65 or Qt.Key.Key_A)
+        :param picker: the hotkey picker the key is for, its key filter and cancel key are respected
+        :param limit: the maximum number of keys to return
+        :return: list of free key codes, ranked by how close they are to the key
+        """
+
+        index = KeyIndex.getIndex(key)
+        if index is None or limit <= 0:
+            return []
+
+        if picker is None:
+            candidates = self.__get_candidates(index)
+        else:
+            candidates = self.__get_picker_candidates(index, picker)
+
+        # Candidates are already filtered, so only used keys are skipped
+        free_keys = []
+        for candidate in candidates:
+            if self.__is_used(candidate):
+                continue
+
+            free_keys.append(KeyIndex.getKey(candidate))
+            if len(free_keys) == limit:
+                break
+        return free_keys
+
+    def __is_used(self, index: int) -> bool:
+        """Check the bit of a key in the used keys bitset
+
+        :param index: dense index of the key
+        :return: whether the key is used
+        """
+
+        return bool(self.__used[index >> 3] & (1 << (index & 7)))
+
+    def _key_use_changed(self, index: int, used: bool):
+        """Set or clear the bit of a key in the used keys bitset
+
+        :param index: dense index of the key
+        :param used: whether any tracked picker uses the key now
+        """
+
+        if used:
+            self.__used[index >> 3] |= 1 << (index & 7)
+        else:
+            self.__used[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __get_candidates(self, index: int) -> array:
+        """Get the ranked indices of all other keys for a key (computed once per key)
+
+        :param index: dense index of the key
+        :return: indices of the other keys, closest first
+        """
+
+        candidates = self.__candidates.get(index)
+        if candidates is not None:
+            return candidates
+
+        ranked = []
+        for group in FreeKeyIndex.__groups:
+            if index not in group:
+                continue
+            position = group.index(index)
+            ranked += sorted(group, key=lambda i: abs(group.index(i) - position))
+
+        ranked += FreeKeyIndex.__suggested_keys
+
+        # Remove duplicates and the key itself while keeping the order
+        candidates = array('H', [i for i in dict.fromkeys(ranked) if i != index])
+        self.__candidates[index] = candidates
+        return candidates
+
+    def __get_picker_candidates(self, index: int, picker: HotkeyPicker) -> array:
+        """Get the ranked candidates of a key filtered by the key filter and cancel key of a picker
+
+        The filtered candidates of tracked pickers are cached until their filter or cancel key changes.
+
+        :param index: dense index of the key
+        :param picker: the hotkey picker
+        :return: indices of the other keys the picker accepts, closest first
+        """
+
+        filters = (picker.getCancelKey(), picker.isKeyFilterEnabled(),
+                   tuple(picker.getWhitelistedKeys()), tuple(picker.getBlacklistedKeys()))
+        cache = self.__picker_candidates.get(picker)
+        if cache is None or cache[0] != filters:
+            cache = (filters, {})
+            if self.hasPicker(picker):
+                self.__picker_candidates[picker] = cache
+
+        candidates = cache[1].get(index)
+        if candidates is not None:
+            return candidates
+
+        cancel_key, key_filter_enabled, whitelisted_keys, blacklisted_keys = filters
+        excluded = {KeyIndex.getIndex(cancel_key), index}
+        candidates = self.__get_candidates(index)
+
+        if key_filter_enabled and whitelisted_keys:
+            # Whitelisted keys that are not regular keyboard keys are suggested last
+            allowed = [i for i in dict.fromkeys(KeyIndex.getIndex(key) for key in whitelisted_keys) if i is not None]
+            allowed_set = set(allowed)
+            ranked = [i for i in candidates if i in allowed_set]
+            ranked_set = set(ranked)
+            ranked += [i for i in allowed if i not in ranked_set]
+            candidates = [i for i in ranked if i not in excluded]
+        elif key_filter_enabled and blacklisted_keys:
+            excluded.update(KeyIndex.getIndex(key) for key in blacklisted_keys)
+            candidates = [i for i in candidates if i not in excluded]
+        else:
+            candidates = [i for i in candidates if i not in excluded]
+
+        candidates = array('H', candidates)
+        cache[1][index] = candidates
+        return candidates
@@ -1,3 +1,4 @@
+from weakref import WeakSet
 from qtpy.QtCore import Qt, Signal
 from qtpy.QtWidgets import QPushButton
 
@@ -19,6 +20,9 @@ class HotkeyPicker(QPushButton):
     __key_code_map[Qt.Key.Key_Odiaeresis] = 'Ö'
     __key_code_map[Qt.Key.Key_Udiaeresis] = 'Ü'
 
+    # Live instances, used to update their text when a key is renamed
+    __instances = WeakSet()
+
     def __init__(self, parent=None, default_text: str = 'None', selection_text: str = '..',
                  cancel_key: Qt.Key = Qt.Key.Key_Escape, key_filter_enabled: bool = False,
                  whitelisted_keys: list[Qt.Key] = [], blacklisted_keys: list[Qt.Key] = []):
@@ -50,6 +54,7 @@ class HotkeyPicker(QPushButton):
         # Init variables
         self.__selected_key = None
         self.__in_selection = False
+        HotkeyPicker.__instances.add(self)
 
         self.setText(self.__default_text)
 
@@ -133,38 +138,59 @@ class HotkeyPicker(QPushButton):
 
         return self.__in_selection
 
-    def setHotkey(self, hotkey: Qt.Key | int):
-        """Set the hotkey
+    def isKeyAccepted(self, key: Qt.Key | int) -> bool:
+        """Get whether a key can be set as the hotkey (known key that passes the key filter)
 
-        :param hotkey: the key code of the hotkey (e.g. 65 or Qt.Key.Key_A)
+        :param key: the key code (e.g. 65 or Qt.Key.Key_A)
+        :return: whether setHotkey() would accept the key
         """
 
-        # Ignore if filter is enabled and key code is not in whitelisted_keys
+        # Reject if filter is enabled and key code is not in whitelisted_keys
         if (self.__key_filter_enabled and self.__whitelisted_keys
-                and hotkey not in self.__whitelisted_keys):
-            return
-        # Ignore if filter is enabled and key code is in blacklisted_keys
+                and key not in self.__whitelisted_keys):
+            return False
+        # Reject if filter is enabled and key code is in blacklisted_keys
         elif (self.__key_filter_enabled and self.__blacklisted_keys
-              and hotkey in self.__blacklisted_keys):
-            return
+              and key in self.__blacklisted_keys):
+            return False
 
-        # Set hotkey if input key valid
-        key_string = HotkeyPicker.getKeyName(hotkey)
+        return HotkeyPicker.getKeyName(key) is not None
 
-        if key_string is not None:
+    def setHotkey(self, hotkey: Qt.Key | int, emit_signal: bool = True) -> bool:
+        """Set the hotkey
+
+        :param hotkey: the key code of the hotkey (e.g. 65 or Qt.Key.Key_A)
+        :param emit_signal: if the hotkeyChanged signal should be emitted
+        :return: whether the hotkey has been set (False if it is filtered out or unknown)
+        """
+
+        # Set hotkey if input key valid
+        if self.isKeyAccepted(hotkey):
+            key_string = HotkeyPicker.getKeyName(hotkey)
             self.__selected_key = int(hotkey)
-            self.setText(key_string)
+            # Keep showing the selection text until the selection is finished
+            if not self.__in_selection:
+                self.setText(key_string)
             # Emit signal
-            self.__emit_hotkey_changed_signal()
+            if emit_signal:
+                self.__emit_hotkey_changed_signal()
+            return True
 
-    def reset(self):
-        """Reset the hotkey picker to the default state with no hotkey selected"""
+        return False
+
+    def reset(self, emit_signal: bool = True):
+        """Reset the hotkey picker to the default state with no hotkey selected
+
+        :param emit_signal: if the hotkeyChanged signal should be emitted
+        """
 
-        self.setText(self.__default_text)
         self.__selected_key = None
+        if not self.__in_selection:
+            self.setText(self.__default_text)
 
         # Emit signal
-        self.__emit_hotkey_changed_signal()
+        if emit_signal:
+            self.__emit_hotkey_changed_signal()
 
     def getDefaultText(self) -> str:
         """Get the default text"""
@@ -264,6 +290,10 @@ class HotkeyPicker(QPushButton):
     def __emit_hotkey_changed_signal(self):
         """Emit a signal that the selected hotkey has changed"""
 
+        # Skip looking up the key name if nobody would receive the signal (e.g. batched updates)
+        if self.signalsBlocked():
+            return
+
         self.hotkeyChanged.emit(self.__selected_key,
                                 HotkeyPicker.getKeyName(self.__selected_key))
 
@@ -279,10 +309,18 @@ class HotkeyPicker(QPushButton):
 
     @staticmethod
     def setKeyName(key: Qt.Key, name: str):
-        """Override the name of a key
+        """Override the name of a key and update the text of all pickers that have it selected
 
         :param key: key you want to rename
         :param name: new name of the key
         """
 
         HotkeyPicker.__key_code_map[key] = name
+
+        for picker in list(HotkeyPicker.__instances):
+            try:
+                if picker.__selected_key == key and not picker.__in_selection:
+                    picker.setText(name)
+            except RuntimeError:
+                # Underlying Qt object has already been deleted
+                HotkeyPicker.__instances.discard(picker)
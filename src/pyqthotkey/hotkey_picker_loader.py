@@ -0,0 +1,243 @@
+import time
+from functools import partial
+from typing import Callable
+from qtpy.QtCore import Qt, QObject, QSize, QTimer, Signal
+from qtpy.QtWidgets import QFormLayout, QWidget
+from .hotkey_picker import HotkeyPicker
+
+
+class HotkeyPickerPlaceholder(QWidget):
+
+    def __init__(self, parent=None, hotkey: int | None = None, size_hint: QSize = QSize(),
+                 on_click: Callable[[], None] = None):
+        """Create a new HotkeyPickerPlaceholder instance
+
+        :param parent: the parent widget
+        :param hotkey: the key code of the hotkey of the picker it stands in for
+        :param size_hint: the size hint of the picker it stands in for
+        :param on_click: called when the placeholder is clicked
+            (a plain callback since connecting a signal for every placeholder is slower than creating it)
+        """
+
+        super(HotkeyPickerPlaceholder, self).__init__(parent)
+
+        self.__hotkey = hotkey
+        self.__size_hint = size_hint
+        self.__on_click = on_click
+
+    def getHotkey(self) -> int | None:
+        """Get the hotkey of the picker the placeholder stands in for
+
+        :return: key code, None if no hotkey is selected
+        """
+
+        return self.__hotkey
+
+    def getHotkeyName(self) -> str:
+        """Get the name of the hotkey of the picker the placeholder stands in for
+
+        :return: string with the key name, None if no hotkey is selected
+        """
+
+        return HotkeyPicker.getKeyName(self.__hotkey)
+
+    def sizeHint(self) -> QSize:
+        """Get the size hint of the picker the placeholder stands in for"""
+
+        return self.__size_hint
+
+    def mousePressEvent(self, event):
+        """Request the picker to be created
+
+        :param event: event sent by PyQt
+        """
+
+        if self.__on_click is not None:
+            self.__on_click()
+
+
+class HotkeyPickerLoader(QObject):
+
+    # Signal that a hotkey picker has been created after the constructor returned (action name, hotkey picker)
+    pickerCreated = Signal(str, object)
+
+    # Signal that all hotkey pickers have been created
+    finished = Signal()
+
+    def __init__(self, layout: QFormLayout, keymap: dict, visible_count: int = 20,
+                 chunk_budget: int = 8, picker_options: dict = None, parent=None):
+        """Create a new HotkeyPickerLoader instance and add a row for every action to the layout
+
+        :param layout: the form layout the rows are added to (must be set on a widget)
+        :param keymap: dict with the action names as keys and the key codes as values (None for no hotkey)
+        :param visible_count: number of pickers that are created immediately
+            (pickerCreated is not emitted for them, use getPicker() to get them)
+        :param chunk_budget: time in milliseconds the pickers of a chunk may take to be created
+        :param picker_options: keyword arguments passed to every HotkeyPicker
+        :param parent: the parent object
+        """
+
+        super(HotkeyPickerLoader, self).__init__(parent)
+
+        # Init arguments
+        self.__layout = layout
+        self.__chunk_budget = chunk_budget
+        self.__picker_options = picker_options if picker_options is not None else {}
+
+        # Temporary picker with the picker options, keys its key filter rejects are stored as no hotkey
+        # so that the state reported before a picker is created matches the picker
+        template_picker = HotkeyPicker(**self.__picker_options)
+        self.__keymap = {action: int(key) if key is not None and template_picker.isKeyAccepted(key) else None
+                         for action, key in keymap.items()}
+
+        # Init variables
+        self.__pickers = {}
+        self.__placeholders = {}
+        self.__pending = []
+
+        # Create the visible pickers immediately and placeholders for all other rows
+        parent_widget = self.__layout.parentWidget()
+        size_hint = None
+        for i, action in enumerate(self.__keymap):
+            if i < visible_count:
+                picker = self.__create_picker(action)
+                self.__layout.addRow(action, picker)
+                if size_hint is None:
+                    size_hint = picker.sizeHint()
+            else:
+                if size_hint is None:
+                    size_hint = template_picker.sizeHint()
+                placeholder = HotkeyPickerPlaceholder(parent_widget, self.__keymap[action], size_hint,
+                                                      partial(self.__placeholder_clicked, action))
+                self.__placeholders[action] = placeholder
+                self.__pending.append(action)
+                self.__layout.addRow(action, placeholder)
+        template_picker.deleteLater()
+
+        # Create the remaining pickers in chunks whenever the event loop is idle
+        self.__pending.reverse()
+        self.__timer = QTimer(self)
+        self.__timer.setInterval(0)
+        self.__timer.timeout.connect(self.__create_chunk)
+        if self.__pending:
+            self.__timer.start()
+        else:
+            QTimer.singleShot(0, self.finished.emit)
+
+    def getPicker(self, action: str) -> HotkeyPicker | None:
+        """Get the hotkey picker of an action, creating it immediately if necessary
+
+        Pickers of the first visible_count actions are created by the constructor before any slot
+        can be connected to pickerCreated, so this is the way to get them.
+
+        :param action: name of the action
+        :return: the hotkey picker, None if there is no such action
+        """
+
+        if action in self.__placeholders:
+            self.__materialize(action)
+        return self.__pickers.get(action)
+
+    def getHotkey(self, action: str) -> int | None:
+        """Get the selected hotkey of an action, whether its picker has been created or not
+
+        :param action: name of the action
+        :return: key code, None if no hotkey is selected
+        """
+
+        picker = self.__pickers.get(action)
+        if picker is not None:
+            return picker.getHotkey()
+        return self.__keymap.get(action)
+
+    def getHotkeyName(self, action: str) -> str:
+        """Get the name of the selected hotkey of an action, whether its picker has been created or not
+
+        :param action: name of the action
+        :return: string with the key name, None if no hotkey is selected
+        """
+
+        return HotkeyPicker.getKeyName(self.getHotkey(action))
+
+    def getKeymap(self) -> dict:
+        """Get the selected hotkeys of all actions
+
+        :return: dict with the action names as keys and the key codes as values
+        """
+
+        return {action: self.getHotkey(action) for action in self.__keymap}
+
+    def isFinished(self) -> bool:
+        """Get whether all hotkey pickers have been created
+
+        :return: whether all pickers have been created
+        """
+
+        return not self.__placeholders
+
+    def finish(self):
+        """Create all remaining hotkey pickers immediately"""
+
+        while self.__pending:
+            action = self.__pending.pop()
+            if action in self.__placeholders:
+                self.__materialize(action)
+
+    def __create_chunk(self):
+        """Create pending pickers until the time budget of the chunk is used up"""
+
+        deadline = time.perf_counter() + self.__chunk_budget / 1000
+        while self.__pending:
+            action = self.__pending.pop()
+            if action in self.__placeholders:
+                self.__materialize(action)
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self.__pending:
+            self.__stop()
+
+    def __stop(self):
+        """Stop creating pickers and emit that all pickers have been created"""
+
+        if self.__timer.isActive():
+            self.__timer.stop()
+            self.finished.emit()
+
+    def __materialize(self, action: str):
+        """Replace the placeholder of an action with its hotkey picker
+
+        :param action: name of the action
+        """
+
+        placeholder = self.__placeholders.pop(action)
+        picker = self.__create_picker(action)
+        self.__layout.replaceWidget(placeholder, picker)
+        placeholder.deleteLater()
+        self.pickerCreated.emit(action, picker)
+
+        if not self.__placeholders:
+            self.__pending.clear()
+            self.__stop()
+
+    def __create_picker(self, action: str) -> HotkeyPicker:
+        """Create the hotkey picker of an action
+
+        :param action: name of the action
+        :return: the hotkey picker
+        """
+
+        picker = HotkeyPicker(self.__layout.parentWidget(), **self.__picker_options)
+        if self.__keymap[action] is not None:
+            picker.setHotkey(self.__keymap[action])
+        self.__pickers[action] = picker
+        return picker
+
+    def __placeholder_clicked(self, action: str):
+        """Create the picker of a clicked placeholder and start the selection
+
+        :param action: name of the action
+        """
+
+        picker = self.getPicker(action)
+        picker.setFocus(Qt.FocusReason.MouseFocusReason)
@@ -0,0 +1,122 @@
+import time
+from array import array
+from qtpy.QtCore import Qt, QObject, QEvent
+from .hotkey_picker import HotkeyPicker
+from .key_index import KeyIndex, PickerKeyTracker
+
+
+class HotkeyUsageTracker(PickerKeyTracker):
+
+    def __init__(self, parent=None):
+        """Create a new HotkeyUsageTracker instance
+
+        :param parent: the parent object
+        """
+
+        super(HotkeyUsageTracker, self).__init__(parent)
+
+        # Init variables (all arrays are indexed by the dense key index)
+        key_count = KeyIndex.getKeyCount()
+        self.__counts = array('Q', [0]) * key_count
+        self.__last_used = array('d', [0.0]) * key_count
+
+    def record(self, key: Qt.Key | int):
+        """Record an activation of a hotkey (ignored if no tracked picker has the key)
+
+        :param key: the key that was pressed (e.g. 65 or Qt.Key.Key_A)
+        """
+
+        index = KeyIndex.getIndex(key)
+        if index is not None and self._get_use_count(index):
+            self.__counts[index] += 1
+            self.__last_used[index] = time.time()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Record key presses of bound hotkeys (install on the widget that handles the hotkeys)
+
+        :param watched: the object that receives the event
+        :param event: event sent by PyQt
+        :return: always False so that the event is not filtered out
+        """
+
+        if (event.type() == QEvent.Type.KeyPress and not event.isAutoRepeat()
+                and not isinstance(watched, HotkeyPicker)):
+            self.record(event.key())
+        return False
+
+    def getUsageCount(self, key: Qt.Key | int) -> int:
+        """Get how often a hotkey has been activated
+
+        :param key: the key (e.g. 65 or Qt.Key.Key_A)
+        :return: number of activations
+        """
+
+        index = KeyIndex.getIndex(key)
+        return 0 if index is None else self.__counts[index]
+
+    def getLastUsed(self, key: Qt.Key | int) -> float | None:
+        """Get when a hotkey has last been activated
+
+        :param key: the key (e.g. 65 or Qt.Key.Key_A)
+        :return: unix timestamp, None if the hotkey has never been activated
+        """
+
+        index = KeyIndex.getIndex(key)
+        if index is None or self.__counts[index] == 0:
+            return None
+        return self.__last_used[index]
+
+    def getPickerUsageCount(self, picker: HotkeyPicker) -> int:
+        """Get how often the current hotkey of a picker has been activated
+
+        :param picker: the hotkey picker
+        :return: number of activations, 0 if the picker has no hotkey
+        """
+
+        return 0 if picker.getHotkey() is None else self.getUsageCount(picker.getHotkey())
+
+    def getUnusedKeys(self) -> list[int]:
+        """Get the bound hotkeys that have never been activated
+
+        :return: list of key codes
+        """
+
+        return [KeyIndex.getKey(index) for index in range(KeyIndex.getKeyCount())
+                if self._get_use_count(index) and self.__counts[index] == 0]
+
+    def snapshot(self) -> tuple[array, array]:
+        """Get a copy of the raw counters, indexed by KeyIndex.getIndex()
+
+        :return: tuple with the array of activation counts and the array of last used timestamps
+        """
+
+        return array('Q', self.__counts), array('d', self.__last_used)
+
+    def exportStats(self) -> dict:
+        """Export the stats of all activated hotkeys (e.g. to save them as JSON)
+
+        :return: dict with the key codes as keys and lists of the count and last used timestamp as values
+        """
+
+        return {KeyIndex.getKey(index): [count, self.__last_used[index]]
+                for index, count in enumerate(self.__counts) if count}
+
+    def mergeStats(self, stats: dict):
+        """Merge exported stats (e.g. from a previous session) into the current stats
+
+        :param stats: dict returned by exportStats() (key codes may also be strings, as loaded from JSON)
+        """
+
+        for key, (count, last_used) in stats.items():
+            index = KeyIndex.getIndex(int(key))
+            if index is None:
+                continue
+            self.__counts[index] += count
+            self.__last_used[index] = max(self.__last_used[index], last_used)
+
+    def reset(self):
+        """Reset the stats of all hotkeys"""
+
+        key_count = KeyIndex.getKeyCount()
+        self.__counts = array('Q', [0]) * key_count
+        self.__last_used = array('d', [0.0]) * key_count
@@ -0,0 +1,143 @@
+from array import array
+from qtpy.QtCore import Qt, QObject
+from .hotkey_picker import HotkeyPicker
+
+
+class KeyIndex:
+
+    # Sorted key codes of all keys, the position of a key is its dense index
+    __keys = sorted({int(value) for value in vars(Qt).values() if isinstance(value, Qt.Key)})
+    __indices = {key: index for index, key in enumerate(__keys)}
+
+    @staticmethod
+    def getIndex(key: Qt.Key | int | None) -> int | None:
+        """Get the dense index of a key
+
+        :param key: the key (e.g. 65 or Qt.Key.Key_A)
+        :return: index between 0 and getKeyCount() - 1, None if the key is unknown
+        """
+
+        return KeyIndex.__indices.get(key)
+
+    @staticmethod
+    def getKey(index: int) -> int:
+        """Get the key code at a dense index
+
+        :param index: the index of the key
+        :return: key code
+        """
+
+        return KeyIndex.__keys[index]
+
+    @staticmethod
+    def getKeyCount() -> int:
+        """Get the number of indexed keys
+
+        :return: number of keys
+        """
+
+        return len(KeyIndex.__keys)
+
+
+class PickerKeyTracker(QObject):
+
+    def __init__(self, parent=None):
+        """Create a new PickerKeyTracker instance (base class for features that track picker hotkeys)
+
+        :param parent: the parent object
+        """
+
+        super(PickerKeyTracker, self).__init__(parent)
+
+        # Init variables (number of tracked pickers per key, indexed by the dense key index)
+        self.__use_counts = array('I', [0]) * KeyIndex.getKeyCount()
+        self.__pickers = {}
+        self.__slots = {}
+
+    def addPicker(self, picker: HotkeyPicker):
+        """Start tracking the hotkey of a hotkey picker
+
+        :param picker: the hotkey picker
+        """
+
+        if picker in self.__pickers:
+            return
+
+        self.__pickers[picker] = None
+        self.__slots[picker] = lambda key, key_name: self.__set_picker_key(picker, key)
+        picker.hotkeyChanged.connect(self.__slots[picker])
+        self.__set_picker_key(picker, picker.getHotkey())
+
+    def removePicker(self, picker: HotkeyPicker):
+        """Stop tracking the hotkey of a hotkey picker
+
+        :param picker: the hotkey picker
+        """
+
+        if picker not in self.__pickers:
+            return
+
+        self.__set_picker_key(picker, None)
+        del self.__pickers[picker]
+        picker.hotkeyChanged.disconnect(self.__slots.pop(picker))
+
+    def hasPicker(self, picker: HotkeyPicker) -> bool:
+        """Get whether the hotkey of a hotkey picker is tracked
+
+        :param picker: the hotkey picker
+        :return: whether the picker is tracked
+        """
+
+        return picker in self.__pickers
+
+    def refresh(self):
+        """Read the hotkeys of all tracked pickers again
+
+        hotkeyChanged is not emitted for changes made with blocked signals or emit_signal=False
+        (e.g. by ProfileManager.switchProfile()), so call this after such changes.
+        """
+
+        for picker in self.__pickers:
+            self.__set_picker_key(picker, picker.getHotkey())
+
+    def _get_use_count(self, index: int) -> int:
+        """Get the number of tracked pickers that use a key
+
+        :param index: dense index of the key
+        :return: number of pickers
+        """
+
+        return self.__use_counts[index]
+
+    def _key_use_changed(self, index: int, used: bool):
+        """Called when the first picker starts or the last picker stops using a key
+
+        :param index: dense index of the key
+        :param used: whether any tracked picker uses the key now
+        """
+
+        pass
+
+    def __set_picker_key(self, picker: HotkeyPicker, key: int | None):
+        """Move the use of a picker from its previous key to its new key
+
+        :param picker: the hotkey picker
+        :param key: the new key code of the picker, None if it has no hotkey
+        """
+
+        previous_index = self.__pickers[picker]
+        index = KeyIndex.getIndex(key)
+        if index == previous_index:
+            return
+
+        if previous_index is not None:
+            self.__use_counts[previous_index] -= 1
+            if self.__use_counts[previous_index] == 0:
+                self._key_use_changed(previous_index, False)
+
+        if index is not None:
+            self.__use_counts[index] += 1
+            if self.__use_counts[index] == 1:
+                self._key_use_changed(index, True)
+
+        self.__pickers[picker] = index
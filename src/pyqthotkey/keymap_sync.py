@@ -0,0 +1,263 @@
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager
+from qtpy.QtCore import QObject, QFileSystemWatcher, Signal
+from .hotkey_picker import HotkeyPicker
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class KeymapSync(QObject):
+
+    # Signal that hotkeys have been changed by another process
+    keymapReloaded = Signal(dict)
+
+    def __init__(self, path: str, parent=None):
+        """Create a new KeymapSync instance
+
+        :param path: path of the shared keymap file (created if it doesn't exist)
+        :param parent: the parent object
+        """
+
+        super(KeymapSync, self).__init__(parent)
+
+        # Init variables
+        self.__path = path
+        self.__instance_id = uuid.uuid4().hex
+        self.__offset = 0
+        self.__generation = None
+        self.__keymap = {}
+        self.__pickers = {}
+        self.__slots = {}
+        self.__applying_action = None
+
+        # Make sure the shared file exists so it can be watched
+        open(self.__path, 'ab').close()
+
+        # Load the current state of the keymap
+        self.__keymap.update(self.__read_delta())
+
+        self.__watcher = QFileSystemWatcher([self.__path], self)
+        self.__watcher.fileChanged.connect(self.__file_changed)
+
+    def addPicker(self, action: str, picker: HotkeyPicker):
+        """Add a hotkey picker that should be kept in sync
+
+        :param action: unique name of the action the hotkey is bound to (no tabs or line breaks)
+        :param picker: the hotkey picker
+        """
+
+        # Tabs and line breaks would break the format of the shared file
+        if '\t' in action or '\n' in action or '\r' in action:
+            raise ValueError('Action name must not contain tabs or line breaks: {!r}'.format(action))
+
+        # Disconnect the previous picker of the action so it doesn't keep writing under it
+        self.removePicker(action)
+        self.__pickers[action] = picker
+
+        # Apply the shared hotkey if another process already set one
+        if action in self.__keymap:
+            self.__apply({action: self.__keymap[action]})
+
+        self.__slots[action] = lambda key, key_name: self.__write(action, key)
+        picker.hotkeyChanged.connect(self.__slots[action])
+
+    def removePicker(self, action: str):
+        """Stop syncing the hotkey picker of an action
+
+        :param action: name of the action
+        """
+
+        picker = self.__pickers.pop(action, None)
+        if picker is not None:
+            picker.hotkeyChanged.disconnect(self.__slots.pop(action))
+
+    def getPath(self) -> str:
+        """Get the path of the shared keymap file"""
+
+        return self.__path
+
+    def getKeymap(self) -> dict:
+        """Get the last known hotkey of every action in the shared file
+
+        :return: dict with the action names as keys and the key codes as values
+        """
+
+        return dict(self.__keymap)
+
+    def reload(self):
+        """Read changes made by other processes and apply them to the pickers"""
+
+        self.__merge(self.__read_delta())
+
+    def compact(self):
+        """Replace the shared file with a file that only contains the latest hotkey of every action"""
+
+        # Other instances append under the same lock, so no change is lost while the file is replaced
+        with self.__lock():
+            changes = self.__read_delta()
+
+            # New generation so that other instances notice the new file and read it from the start
+            generation = uuid.uuid4().hex
+            lines = [self.__format_line(action, key) for action, key in {**self.__keymap, **changes}.items()]
+            data = '#{}\n'.format(generation).encode('utf-8') + b''.join(lines)
+
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.__path)))
+            try:
+                with os.fdopen(file_descriptor, 'wb') as file:
+                    file.write(data)
+                os.chmod(temp_path, os.stat(self.__path).st_mode & 0o777)
+                os.replace(temp_path, self.__path)
+            except OSError:
+                os.remove(temp_path)
+                raise
+
+            self.__generation = generation
+            self.__offset = len(data)
+
+        self.__merge(changes)
+
+    def __write(self, action: str, key: int | None):
+        """Append a change to the shared file
+
+        :param action: name of the action
+        :param key: the new key code, None if the hotkey was reset
+        """
+
+        # Don't echo changes that have just been read from the shared file
+        if action == self.__applying_action:
+            return
+
+        self.__keymap[action] = key
+
+        # Single write call so that lines from different processes don't interleave
+        with self.__lock():
+            with open(self.__path, 'ab') as file:
+                file.write(self.__format_line(action, key))
+
+    @contextmanager
+    def __lock(self):
+        """Hold an exclusive lock on the lock file next to the shared file"""
+
+        with open(self.__path + '.lock', 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def __format_line(self, action: str, key: int | None) -> bytes:
+        """Get the line that represents a change in the shared file
+
+        :param action: name of the action
+        :param key: the key code, None if no hotkey is selected
+        :return: encoded line
+        """
+
+        key_string = '' if key is None else str(int(key))
+        return '{}\t{}\t{}\n'.format(self.__instance_id, action, key_string).encode('utf-8')
+
+    def __read_delta(self) -> dict:
+        """Read every complete line that was appended since the last read
+
+        :return: dict with the actions whose hotkey has changed and their latest key codes
+        """
+
+        try:
+            with open(self.__path, 'rb') as file:
+                # Compacted files start with a generation header, a new generation means a new file
+                first_line = file.readline()
+                generation = first_line[1:].strip().decode('utf-8', 'replace') if first_line.startswith(b'#') else None
+                file.seek(0, os.SEEK_END)
+
+                if generation != self.__generation or file.tell() < self.__offset:
+                    self.__generation = generation
+                    self.__offset = 0
+
+                file.seek(self.__offset)
+                data = file.read()
+        except OSError:
+            return {}
+
+        # Leave incomplete lines for the next read
+        end = data.rfind(b'\n') + 1
+        self.__offset += end
+
+        changes = {}
+        for line in data[:end].split(b'\n'):
+            parts = line.decode('utf-8', 'replace').split('\t')
+            if len(parts) != 3:
+                continue
+
+            # Own lines are newer than the foreign lines before them, so those changes are outdated
+            if parts[0] == self.__instance_id:
+                changes.pop(parts[1], None)
+                continue
+
+            try:
+                changes[parts[1]] = int(parts[2]) if parts[2] else None
+            except ValueError:
+                continue
+
+        # Only keep actions whose latest hotkey differs from the known one
+        return {action: key for action, key in changes.items()
+                if action not in self.__keymap or self.__keymap[action] != key}
+
+    def __merge(self, changes: dict):
+        """Merge changes read from the shared file into the keymap and the pickers
+
+        :param changes: dict with the action names as keys and the key codes as values
+        """
+
+        if not changes:
+            return
+
+        self.__keymap.update(changes)
+        self.__apply(changes)
+        self.keymapReloaded.emit(changes)
+
+    def __apply(self, changes: dict):
+        """Apply changes to the pickers without writing them back to the shared file
+
+        :param changes: dict with the action names as keys and the key codes as values
+        """
+
+        for action, key in changes.items():
+            picker = self.__pickers.get(action)
+            if picker is None or picker.getHotkey() == key:
+                continue
+
+            # The pickers still emit hotkeyChanged, only writing the change back is skipped
+            self.__applying_action = action
+            try:
+                if key is None:
+                    picker.reset()
+                else:
+                    picker.setHotkey(key)
+            finally:
+                self.__applying_action = None
+
+    def __file_changed(self, path: str):
+        """Reload the keymap when the shared file changes
+
+        :param path: path of the changed file
+        """
+
+        # Some editors and tools replace the file, which removes it from the watcher
+        if path not in self.__watcher.files() and os.path.exists(path):
+            self.__watcher.addPath(path)
+
+        self.reload()
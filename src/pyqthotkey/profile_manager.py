@@ -0,0 +1,240 @@
+from array import array
+from qtpy.QtCore import Qt, QObject, Signal
+from .hotkey_picker import HotkeyPicker
+
+
+class ProfileManager(QObject):
+
+    # Signal that the profile has been switched
+    # (profile name, names of the changed actions, names of the actions whose key was rejected by the key filter)
+    profileSwitched = Signal(str, list, list)
+
+    # Value stored for pickers without a hotkey
+    __NO_KEY = -1
+
+    def __init__(self, parent=None):
+        """Create a new ProfileManager instance
+
+        :param parent: the parent object
+        """
+
+        super(ProfileManager, self).__init__(parent)
+
+        # Init variables
+        self.__actions = []
+        self.__action_indices = {}
+        self.__pickers = []
+        self.__profiles = {}
+        self.__diffs = {}
+        self.__current_profile = None
+
+        # Whether the pickers may differ from the current profile, which makes the next switch read them
+        self.__stale = True
+
+    def addPicker(self, action: str, picker: HotkeyPicker):
+        """Add a hotkey picker that is managed by the profiles
+
+        :param action: unique name of the action the hotkey is bound to
+        :param picker: the hotkey picker
+        """
+
+        index = len(self.__pickers)
+        self.__actions.append(action)
+        self.__action_indices[action] = index
+        self.__pickers.append(picker)
+
+        # Existing profiles have no hotkey for the new action, except the current one
+        for name, keys in self.__profiles.items():
+            if name == self.__current_profile:
+                keys.append(ProfileManager.__to_code(picker.getHotkey()))
+            else:
+                keys.append(ProfileManager.__NO_KEY)
+        self.__diffs.clear()
+
+        picker.hotkeyChanged.connect(lambda key, key_name: self.__picker_changed(index, key))
+
+    def addProfile(self, name: str, keymap: dict):
+        """Add a profile or replace an existing one
+
+        :param name: name of the profile
+        :param keymap: dict with the action names as keys and the key codes as values
+            (actions that are not in the dict have no hotkey)
+        """
+
+        keys = array('i', [ProfileManager.__NO_KEY]) * len(self.__pickers)
+        for action, key in keymap.items():
+            index = self.__action_indices.get(action)
+            if index is not None:
+                keys[index] = ProfileManager.__to_code(key)
+
+        self.__profiles[name] = keys
+        self.__invalidate_diffs(name)
+
+        # Replacing the current profile applies it immediately
+        if name == self.__current_profile:
+            self.__current_profile = None
+            self.switchProfile(name)
+
+    def saveProfile(self, name: str):
+        """Save the current hotkeys of all pickers as a profile
+
+        :param name: name of the profile
+        """
+
+        self.__profiles[name] = array('i', [ProfileManager.__to_code(picker.getHotkey())
+                                            for picker in self.__pickers])
+        self.__invalidate_diffs(name)
+
+    def removeProfile(self, name: str):
+        """Remove a profile
+
+        :param name: name of the profile
+        """
+
+        if self.__profiles.pop(name, None) is not None:
+            self.__invalidate_diffs(name)
+            if name == self.__current_profile:
+                self.__current_profile = None
+
+    def getProfile(self, name: str) -> dict | None:
+        """Get the hotkeys of a profile
+
+        :param name: name of the profile
+        :return: dict with the action names as keys and the key codes as values, None if there is no such profile
+        """
+
+        keys = self.__profiles.get(name)
+        if keys is None:
+            return None
+        return {action: ProfileManager.__from_code(key) for action, key in zip(self.__actions, keys)}
+
+    def getProfileNames(self) -> list[str]:
+        """Get the names of all profiles
+
+        :return: list of profile names
+        """
+
+        return list(self.__profiles.keys())
+
+    def getCurrentProfile(self) -> str | None:
+        """Get the name of the current profile
+
+        :return: name of the current profile, None if no profile has been applied
+        """
+
+        return self.__current_profile
+
+    def refresh(self):
+        """Read the hotkeys of all pickers again on the next switch
+
+        hotkeyChanged is not emitted for changes made with blocked signals or emit_signal=False,
+        so call this after such changes.
+        """
+
+        self.__stale = True
+
+    def switchProfile(self, name: str) -> bool:
+        """Switch to a profile, only updating the pickers whose hotkey differs
+
+        :param name: name of the profile
+        :return: whether the profile exists
+        """
+
+        target = self.__profiles.get(name)
+        if target is None:
+            return False
+
+        # The cached diff is only used while the pickers are known to have the hotkeys of the current profile
+        no_key = ProfileManager.__NO_KEY
+        if self.__current_profile is not None and not self.__stale:
+            changed = self.__get_diff(self.__current_profile, name)
+        else:
+            current = array('i', [no_key if key is None else key
+                                  for key in [picker.getHotkey() for picker in self.__pickers]])
+            changed = ProfileManager.__diff(current, target)
+
+        # Suspend repaints while the changed pickers are updated without emitting hotkeyChanged
+        pickers = [self.__pickers[index] for index in changed]
+        windows = [window for window in {picker.window() for picker in pickers} if window.updatesEnabled()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+
+        changed_actions = []
+        rejected_actions = []
+        for index, picker in zip(changed, pickers):
+            key = target[index]
+            if key == no_key:
+                picker.reset(emit_signal=False)
+            elif not picker.setHotkey(key, emit_signal=False):
+                # The key filter of the picker rejected the key, the profile itself is left unchanged
+                rejected_actions.append(self.__actions[index])
+                continue
+            changed_actions.append(self.__actions[index])
+
+        for window in windows:
+            window.setUpdatesEnabled(True)
+
+        # Pickers that rejected their key still have their previous hotkey
+        self.__current_profile = name
+        self.__stale = bool(rejected_actions)
+        self.profileSwitched.emit(name, changed_actions, rejected_actions)
+        return True
+
+    def __get_diff(self, source: str, target: str) -> array:
+        """Get the cached indices of the pickers whose hotkeys differ between two profiles
+
+        :param source: name of the profile that is switched from
+        :param target: name of the profile that is switched to
+        :return: indices of the changed pickers
+        """
+
+        diff = self.__diffs.get((source, target))
+        if diff is None:
+            diff = ProfileManager.__diff(self.__profiles[source], self.__profiles[target])
+            self.__diffs[(source, target)] = diff
+            self.__diffs[(target, source)] = diff
+        return diff
+
+    def __invalidate_diffs(self, name: str):
+        """Remove the cached diffs of a profile
+
+        :param name: name of the profile
+        """
+
+        for pair in [pair for pair in self.__diffs if name in pair]:
+            del self.__diffs[pair]
+
+    def __picker_changed(self, index: int, key: int | None):
+        """Update the current profile when a picker is changed by the user
+
+        :param index: index of the changed picker
+        :param key: the new key code, None if the hotkey was reset
+        """
+
+        if self.__current_profile is not None:
+            self.__profiles[self.__current_profile][index] = ProfileManager.__to_code(key)
+            self.__invalidate_diffs(self.__current_profile)
+        self.__stale = True
+
+    @staticmethod
+    def __diff(source: array, target: array) -> array:
+        """Get the indices at which two profiles differ
+
+        :param source: the keys of the first profile
+        :param target: the keys of the second profile
+        :return: indices of the differing keys
+        """
+
+        return array('i', [i for i, (a, b) in enumerate(zip(source, target)) if a != b])
+
+    @staticmethod
+    def __to_code(key: Qt.Key | int | None) -> int:
+        """Convert a key to the value stored in a profile"""
+
+        return ProfileManager.__NO_KEY if key is None else int(key)
+
+    @staticmethod
+    def __from_code(key: int) -> int | None:
+        """Convert a value stored in a profile to a key code"""
+
+        return None if key == ProfileManager.__NO_KEY else key
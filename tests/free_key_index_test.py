@@ -0,0 +1,135 @@
+from PyQt6.QtCore import Qt
+from src.pyqthotkey import HotkeyPicker, FreeKeyIndex, HotkeyUsageTracker
+
+
+def test_used_keys(qtbot):
+    """Test tracking the used keys as the hotkeys change"""
+
+    free_key_index = FreeKeyIndex()
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_A)
+    free_key_index.addPicker(hotkey_picker_1)
+    free_key_index.addPicker(hotkey_picker_2)
+    assert free_key_index.isKeyUsed(Qt.Key.Key_A)
+    assert free_key_index.getUsedKeys() == [Qt.Key.Key_A]
+
+    # Key stays used while another picker still has it
+    hotkey_picker_2.setHotkey(Qt.Key.Key_A)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_B)
+    assert free_key_index.getUsedKeys() == [Qt.Key.Key_A, Qt.Key.Key_B]
+    hotkey_picker_2.reset()
+    assert not free_key_index.isKeyUsed(Qt.Key.Key_A)
+    assert not free_key_index.isKeyUsed(-1)
+
+    # Changes with blocked signals are picked up by refresh()
+    hotkey_picker_1.blockSignals(True)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_C)
+    hotkey_picker_1.blockSignals(False)
+    free_key_index.refresh()
+    assert free_key_index.getUsedKeys() == [Qt.Key.Key_C]
+
+    free_key_index.removePicker(hotkey_picker_1)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_D)
+    assert free_key_index.getUsedKeys() == []
+
+
+def test_free_keys_ranking(qtbot):
+    """Test ranking free keys by keyboard row and category"""
+
+    free_key_index = FreeKeyIndex()
+    hotkey_picker = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker)
+    free_key_index.addPicker(hotkey_picker)
+    hotkey_picker.setHotkey(Qt.Key.Key_S)
+
+    # Same row first, ordered by distance
+    assert free_key_index.getFreeKeys(Qt.Key.Key_D, limit=4) == [
+        Qt.Key.Key_F, Qt.Key.Key_A, Qt.Key.Key_G, Qt.Key.Key_CapsLock]
+
+    # Same category after the row
+    free_keys = free_key_index.getFreeKeys(Qt.Key.Key_Left, limit=6)
+    assert free_keys[:3] == [Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Right]
+    assert set(free_keys[3:]) <= {Qt.Key.Key_Insert, Qt.Key.Key_Home, Qt.Key.Key_PageUp,
+                                  Qt.Key.Key_Delete, Qt.Key.Key_End, Qt.Key.Key_PageDown}
+
+    assert len(free_key_index.getFreeKeys(Qt.Key.Key_F1, limit=100)) == 100
+    assert free_key_index.getFreeKeys(-1) == []
+
+
+def test_free_keys_filter(qtbot):
+    """Test that the key filter and cancel key of the picker are respected"""
+
+    free_key_index = FreeKeyIndex()
+    hotkey_picker = HotkeyPicker(key_filter_enabled=True,
+                                 whitelisted_keys=[Qt.Key.Key_F1, Qt.Key.Key_F2, Qt.Key.Key_F3, Qt.Key.Key_F4])
+    qtbot.addWidget(hotkey_picker)
+    free_key_index.addPicker(hotkey_picker)
+    hotkey_picker.setHotkey(Qt.Key.Key_F2)
+
+    assert free_key_index.getFreeKeys(Qt.Key.Key_F2, hotkey_picker) == [
+        Qt.Key.Key_F1, Qt.Key.Key_F3, Qt.Key.Key_F4]
+
+    hotkey_picker.setBlacklistedKeys([Qt.Key.Key_F1, Qt.Key.Key_F3])
+    assert free_key_index.getFreeKeys(Qt.Key.Key_F2, hotkey_picker, limit=2) == [
+        Qt.Key.Key_F4, Qt.Key.Key_F5]
+
+    # Cancel key (Escape) is never suggested
+    assert Qt.Key.Key_Escape not in free_key_index.getFreeKeys(Qt.Key.Key_F1, hotkey_picker, limit=20)
+
+
+def test_free_keys_only_regular_keys(qtbot):
+    """Test that only regular keyboard keys (and whitelisted keys) are suggested"""
+
+    free_key_index = FreeKeyIndex()
+    free_keys = free_key_index.getFreeKeys(Qt.Key.Key_Space, limit=600)
+    assert Qt.Key.Key_unknown not in free_keys
+    assert Qt.Key.Key_VoiceDial not in free_keys
+    assert Qt.Key.Key_Camera not in free_keys
+    assert Qt.Key.Key_F35 in free_keys
+
+    # Whitelisted keys are suggested even if they are not regular keyboard keys
+    hotkey_picker = HotkeyPicker(key_filter_enabled=True,
+                                 whitelisted_keys=[Qt.Key.Key_Camera, Qt.Key.Key_F2, Qt.Key.Key_F1])
+    qtbot.addWidget(hotkey_picker)
+    free_key_index.addPicker(hotkey_picker)
+    assert free_key_index.getFreeKeys(Qt.Key.Key_F3, hotkey_picker) == [
+        Qt.Key.Key_F2, Qt.Key.Key_F1, Qt.Key.Key_Camera]
+
+    # Cached candidates are updated when the filter of the picker changes
+    hotkey_picker.setWhitelistedKeys([Qt.Key.Key_F4])
+    assert free_key_index.getFreeKeys(Qt.Key.Key_F3, hotkey_picker) == [Qt.Key.Key_F4]
+
+
+def test_shared_picker_tracking(qtbot):
+    """Test that FreeKeyIndex and HotkeyUsageTracker see the same picker keys after removals and refreshes"""
+
+    free_key_index = FreeKeyIndex()
+    hotkey_usage_tracker = HotkeyUsageTracker()
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_A)
+    hotkey_picker_2.setHotkey(Qt.Key.Key_A)
+    for tracker in [free_key_index, hotkey_usage_tracker]:
+        tracker.addPicker(hotkey_picker_1)
+        tracker.addPicker(hotkey_picker_2)
+        tracker.addPicker(hotkey_picker_2)
+        assert tracker.hasPicker(hotkey_picker_2)
+
+    # Key stays used while another picker still has it
+    for tracker in [free_key_index, hotkey_usage_tracker]:
+        tracker.removePicker(hotkey_picker_1)
+        assert not tracker.hasPicker(hotkey_picker_1)
+    assert free_key_index.isKeyUsed(Qt.Key.Key_A)
+    assert hotkey_usage_tracker.getUnusedKeys() == [Qt.Key.Key_A]
+
+    # Changes without hotkeyChanged are picked up by refresh()
+    hotkey_picker_2.setHotkey(Qt.Key.Key_B, emit_signal=False)
+    free_key_index.refresh()
+    hotkey_usage_tracker.refresh()
+    assert free_key_index.getUsedKeys() == [Qt.Key.Key_B]
+    assert hotkey_usage_tracker.getUnusedKeys() == [Qt.Key.Key_B]
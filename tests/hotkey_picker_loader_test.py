@@ -0,0 +1,115 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QWidget, QFormLayout
+from src.pyqthotkey import HotkeyPicker, HotkeyPickerLoader, HotkeyPickerPlaceholder
+
+
+def create_keymap(count):
+    """Create a keymap with an F key for every action"""
+
+    return {'action {}'.format(i): getattr(Qt.Key, 'Key_F{}'.format(i % 12 + 1)) for i in range(count)}
+
+
+def test_progressive_loading(qtbot):
+    """Test creating the visible pickers first and the others in idle time"""
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    layout = QFormLayout(widget)
+    keymap = create_keymap(50)
+    keymap['action 49'] = None
+    created = []
+
+    hotkey_picker_loader = HotkeyPickerLoader(layout, keymap, visible_count=10, chunk_budget=1)
+    hotkey_picker_loader.pickerCreated.connect(lambda action, picker: created.append(action))
+    assert not hotkey_picker_loader.isFinished()
+    assert layout.rowCount() == 50
+    assert isinstance(layout.itemAt(9, QFormLayout.ItemRole.FieldRole).widget(), HotkeyPicker)
+    assert isinstance(layout.itemAt(10, QFormLayout.ItemRole.FieldRole).widget(), HotkeyPickerPlaceholder)
+
+    # State is correct before the pickers are created
+    assert hotkey_picker_loader.getKeymap() == keymap
+    assert hotkey_picker_loader.getHotkeyName('action 40') == 'F5'
+    assert layout.itemAt(40, QFormLayout.ItemRole.FieldRole).widget().getHotkey() == Qt.Key.Key_F5
+
+    with qtbot.waitSignal(hotkey_picker_loader.finished, timeout=5000):
+        pass
+    assert hotkey_picker_loader.isFinished()
+
+    # Visible pickers are created in the constructor, so they are only available through getPicker()
+    assert created == ['action {}'.format(i) for i in range(10, 50)]
+    assert hotkey_picker_loader.getPicker('action 0').getHotkey() == keymap['action 0']
+    assert hotkey_picker_loader.getKeymap() == keymap
+
+    # Placeholder rows have been upgraded in place
+    for i in range(50):
+        picker = layout.itemAt(i, QFormLayout.ItemRole.FieldRole).widget()
+        assert picker is hotkey_picker_loader.getPicker('action {}'.format(i))
+        assert picker.getHotkey() == keymap['action {}'.format(i)]
+
+
+def test_get_picker_and_finish(qtbot):
+    """Test creating pickers on demand and finishing immediately"""
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    layout = QFormLayout(widget)
+    keymap = create_keymap(30)
+
+    hotkey_picker_loader = HotkeyPickerLoader(layout, keymap, visible_count=5,
+                                              picker_options={'default_text': 'Unbound'})
+    picker = hotkey_picker_loader.getPicker('action 20')
+    assert picker.getHotkey() == keymap['action 20']
+    assert picker.getDefaultText() == 'Unbound'
+    assert layout.itemAt(20, QFormLayout.ItemRole.FieldRole).widget() is picker
+    assert hotkey_picker_loader.getPicker('missing') is None
+
+    picker.setHotkey(Qt.Key.Key_A)
+    assert hotkey_picker_loader.getHotkey('action 20') == Qt.Key.Key_A
+
+    with qtbot.waitSignal(hotkey_picker_loader.finished):
+        hotkey_picker_loader.finish()
+    assert hotkey_picker_loader.isFinished()
+    assert all(isinstance(layout.itemAt(i, QFormLayout.ItemRole.FieldRole).widget(), HotkeyPicker)
+               for i in range(30))
+
+
+def test_placeholder_clicked(qtbot):
+    """Test that clicking a placeholder creates its picker"""
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    layout = QFormLayout(widget)
+
+    hotkey_picker_loader = HotkeyPickerLoader(layout, create_keymap(3), visible_count=0)
+    placeholder = layout.itemAt(1, QFormLayout.ItemRole.FieldRole).widget()
+    assert placeholder.sizeHint() == HotkeyPicker().sizeHint()
+    assert placeholder.sizeHint().isValid()
+    QTest.mouseClick(placeholder, Qt.MouseButton.LeftButton)
+    assert layout.itemAt(1, QFormLayout.ItemRole.FieldRole).widget() is hotkey_picker_loader.getPicker('action 1')
+
+    # No placeholders when every picker is visible
+    other_widget = QWidget()
+    qtbot.addWidget(other_widget)
+    hotkey_picker_loader = HotkeyPickerLoader(QFormLayout(other_widget), create_keymap(3))
+    assert hotkey_picker_loader.isFinished()
+    with qtbot.waitSignal(hotkey_picker_loader.finished):
+        pass
+
+
+def test_filtered_picker_options(qtbot):
+    """Test that keys rejected by the key filter of the picker options are not reported before creation"""
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    layout = QFormLayout(widget)
+    keymap = {'a': Qt.Key.Key_F1, 'b': Qt.Key.Key_F1, 'c': Qt.Key.Key_F2}
+    picker_options = {'key_filter_enabled': True, 'blacklisted_keys': [Qt.Key.Key_F1]}
+
+    hotkey_picker_loader = HotkeyPickerLoader(layout, keymap, visible_count=1, picker_options=picker_options)
+    expected_keymap = {'a': None, 'b': None, 'c': Qt.Key.Key_F2}
+    assert hotkey_picker_loader.getKeymap() == expected_keymap
+    assert layout.itemAt(1, QFormLayout.ItemRole.FieldRole).widget().getHotkey() is None
+
+    hotkey_picker_loader.finish()
+    assert hotkey_picker_loader.getKeymap() == expected_keymap
@@ -65,6 +65,59 @@ def test_set_hotkey(qtbot):
     assert hotkey_picker.getHotkey() == Qt.Key.Key_A
 
 
+def test_set_hotkey_in_selection(qtbot):
+    """Test setting the hotkey while the hotkey picker is in selection"""
+
+    hotkey_picker = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker)
+
+    qt_api.QtWidgets.QApplication.sendEvent(hotkey_picker, QFocusEvent(QEvent.Type.FocusIn))
+    hotkey_picker.setHotkey(Qt.Key.Key_F4)
+    assert hotkey_picker.getHotkey() == Qt.Key.Key_F4
+    assert hotkey_picker.text() == hotkey_picker.getSelectionText()
+
+    hotkey_picker.reset()
+    assert hotkey_picker.getHotkey() is None
+    assert hotkey_picker.text() == hotkey_picker.getSelectionText()
+
+    hotkey_picker.setHotkey(Qt.Key.Key_F4)
+    qt_api.QtWidgets.QApplication.sendEvent(hotkey_picker, QFocusEvent(QEvent.Type.FocusOut))
+    assert hotkey_picker.text() == 'F4'
+
+
+def test_set_hotkey_without_signal(qtbot):
+    """Test setting and resetting the hotkey without emitting the hotkeyChanged signal"""
+
+    hotkey_picker = HotkeyPicker(key_filter_enabled=True, blacklisted_keys=[Qt.Key.Key_F1])
+    qtbot.addWidget(hotkey_picker)
+
+    with qtbot.assertNotEmitted(hotkey_picker.hotkeyChanged):
+        assert hotkey_picker.setHotkey(Qt.Key.Key_F2, emit_signal=False)
+        assert not hotkey_picker.setHotkey(Qt.Key.Key_F1, emit_signal=False)
+        assert not hotkey_picker.setHotkey(-1, emit_signal=False)
+    assert hotkey_picker.getHotkey() == Qt.Key.Key_F2
+    assert hotkey_picker.text() == 'F2'
+
+    with qtbot.assertNotEmitted(hotkey_picker.hotkeyChanged):
+        hotkey_picker.reset(emit_signal=False)
+    assert hotkey_picker.getHotkey() is None
+
+
+def test_is_key_accepted(qtbot):
+    """Test checking keys against the key filter without setting them"""
+
+    hotkey_picker = HotkeyPicker(key_filter_enabled=True, whitelisted_keys=[Qt.Key.Key_F1, -1])
+    qtbot.addWidget(hotkey_picker)
+
+    assert hotkey_picker.isKeyAccepted(Qt.Key.Key_F1)
+    assert not hotkey_picker.isKeyAccepted(Qt.Key.Key_F2)
+    assert not hotkey_picker.isKeyAccepted(-1)
+
+    hotkey_picker.setKeyFilterEnabled(False)
+    assert hotkey_picker.isKeyAccepted(Qt.Key.Key_F2)
+    assert hotkey_picker.getHotkey() is None
+
+
 def test_reset(qtbot):
     """Test resetting the hotkey picker"""
 
@@ -222,3 +275,26 @@ def test_set_key_name(qtbot):
     QTest.keyEvent(QTest.KeyAction.Click, hotkey_picker, Qt.Key.Key_Control)
     assert hotkey_picker.getHotkeyName() == 'Ctrl custom name'
     assert HotkeyPicker.getKeyName(Qt.Key.Key_Control) == 'Ctrl custom name'
+
+
+def test_set_key_name_updates_pickers(qtbot):
+    """Test that setKeyName() updates the text of existing pickers that have the key selected"""
+
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_Shift)
+    hotkey_picker_2.setHotkey(Qt.Key.Key_Shift)
+    qt_api.QtWidgets.QApplication.sendEvent(hotkey_picker_2, QFocusEvent(QEvent.Type.FocusIn))
+
+    HotkeyPicker.setKeyName(Qt.Key.Key_Shift, 'Shft')
+    assert hotkey_picker_1.text() == 'Shft'
+    assert hotkey_picker_2.text() == hotkey_picker_2.getSelectionText()
+
+    # Picker in selection shows the new name when it loses focus
+    qt_api.QtWidgets.QApplication.sendEvent(hotkey_picker_2, QFocusEvent(QEvent.Type.FocusOut))
+    assert hotkey_picker_2.text() == 'Shft'
+
+    HotkeyPicker.setKeyName(Qt.Key.Key_Shift, 'Shift')
+    assert hotkey_picker_1.text() == 'Shift'
@@ -0,0 +1,93 @@
+import json
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QWidget
+from src.pyqthotkey import HotkeyPicker, HotkeyUsageTracker
+
+
+def test_record(qtbot):
+    """Test counting activations of bound hotkeys"""
+
+    hotkey_usage_tracker = HotkeyUsageTracker()
+    hotkey_picker = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker)
+    hotkey_picker.setHotkey(Qt.Key.Key_F5)
+    hotkey_usage_tracker.addPicker(hotkey_picker)
+
+    hotkey_usage_tracker.record(Qt.Key.Key_F5)
+    hotkey_usage_tracker.record(Qt.Key.Key_F5)
+    hotkey_usage_tracker.record(Qt.Key.Key_F6)
+    hotkey_usage_tracker.record(-1)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F5) == 2
+    assert hotkey_usage_tracker.getPickerUsageCount(hotkey_picker) == 2
+    assert hotkey_usage_tracker.getLastUsed(Qt.Key.Key_F5) > 0
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F6) == 0
+    assert hotkey_usage_tracker.getLastUsed(Qt.Key.Key_F6) is None
+
+    # Rebinding the picker moves the counting to the new key
+    hotkey_picker.setHotkey(Qt.Key.Key_F6)
+    hotkey_usage_tracker.record(Qt.Key.Key_F5)
+    hotkey_usage_tracker.record(Qt.Key.Key_F6)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F5) == 2
+    assert hotkey_usage_tracker.getPickerUsageCount(hotkey_picker) == 1
+
+    hotkey_picker.reset()
+    assert hotkey_usage_tracker.getPickerUsageCount(hotkey_picker) == 0
+    assert hotkey_usage_tracker.getUnusedKeys() == []
+
+    hotkey_usage_tracker.removePicker(hotkey_picker)
+    hotkey_picker.setHotkey(Qt.Key.Key_F7)
+    hotkey_usage_tracker.record(Qt.Key.Key_F7)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F7) == 0
+
+
+def test_event_filter(qtbot):
+    """Test counting key presses through the event filter"""
+
+    hotkey_usage_tracker = HotkeyUsageTracker()
+    widget = QWidget()
+    hotkey_picker = HotkeyPicker(widget)
+    qtbot.addWidget(widget)
+    hotkey_picker.setHotkey(Qt.Key.Key_A)
+    hotkey_usage_tracker.addPicker(hotkey_picker)
+    widget.installEventFilter(hotkey_usage_tracker)
+    hotkey_picker.installEventFilter(hotkey_usage_tracker)
+
+    QTest.keyClick(widget, Qt.Key.Key_A)
+    QTest.keyClick(widget, Qt.Key.Key_B)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_A) == 1
+
+    # Key presses while picking a hotkey are not counted
+    QTest.keyClick(hotkey_picker, Qt.Key.Key_A)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_A) == 1
+
+
+def test_export_and_merge(qtbot):
+    """Test exporting, merging, snapshotting and resetting the stats"""
+
+    hotkey_usage_tracker = HotkeyUsageTracker()
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F1)
+    hotkey_picker_2.setHotkey(Qt.Key.Key_F2)
+    hotkey_usage_tracker.addPicker(hotkey_picker_1)
+    hotkey_usage_tracker.addPicker(hotkey_picker_2)
+    hotkey_usage_tracker.record(Qt.Key.Key_F1)
+    assert hotkey_usage_tracker.getUnusedKeys() == [Qt.Key.Key_F2]
+
+    stats = hotkey_usage_tracker.exportStats()
+    assert list(stats.keys()) == [Qt.Key.Key_F1]
+    assert stats[Qt.Key.Key_F1][0] == 1
+
+    counts, last_used = hotkey_usage_tracker.snapshot()
+    hotkey_usage_tracker.mergeStats(json.loads(json.dumps(stats)))
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F1) == 2
+    assert sum(counts) == 1
+
+    hotkey_usage_tracker.reset()
+    assert hotkey_usage_tracker.exportStats() == {}
+    hotkey_usage_tracker.mergeStats(stats)
+    assert hotkey_usage_tracker.getUsageCount(Qt.Key.Key_F1) == 1
+    assert hotkey_usage_tracker.getLastUsed(Qt.Key.Key_F1) == stats[Qt.Key.Key_F1][1]
@@ -0,0 +1,242 @@
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+from src.pyqthotkey import HotkeyPicker, KeymapSync
+
+
+def test_sync_between_instances(qtbot, tmp_path):
+    """Test syncing a changed hotkey to another instance"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    sync_2 = KeymapSync(path)
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    sync_1.addPicker('save', hotkey_picker_1)
+    sync_2.addPicker('save', hotkey_picker_2)
+
+    with qtbot.waitSignal(sync_2.keymapReloaded, timeout=2000) as blocker:
+        hotkey_picker_1.setHotkey(Qt.Key.Key_F5)
+    assert blocker.args == [{'save': Qt.Key.Key_F5}]
+    assert hotkey_picker_2.getHotkey() == Qt.Key.Key_F5
+    assert hotkey_picker_2.text() == 'F5'
+
+    hotkey_picker_1.reset()
+    sync_2.reload()
+    assert hotkey_picker_2.getHotkey() is None
+    assert hotkey_picker_2.text() == hotkey_picker_2.getDefaultText()
+
+
+def test_no_echo(qtbot, tmp_path):
+    """Test that applied changes are not written back to the shared file"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    sync_2 = KeymapSync(path)
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_2)
+    sync_2.addPicker('save', hotkey_picker_2)
+
+    hotkey_picker_1 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    sync_1.addPicker('save', hotkey_picker_1)
+    QTest.keyEvent(QTest.KeyAction.Click, hotkey_picker_1, Qt.Key.Key_A)
+    size = (tmp_path / 'keymap').stat().st_size
+
+    sync_2.reload()
+    assert hotkey_picker_2.getHotkey() == Qt.Key.Key_A
+    assert (tmp_path / 'keymap').stat().st_size == size
+
+    # Nothing is echoed back to the first instance either
+    with qtbot.assertNotEmitted(sync_1.keymapReloaded):
+        sync_1.reload()
+
+
+def test_batched_delta(qtbot, tmp_path):
+    """Test reading several changes since the last offset in one update"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    sync_2 = KeymapSync(path)
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    sync_1.addPicker('save', hotkey_picker_1)
+    sync_1.addPicker('open', hotkey_picker_2)
+
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F1)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F2)
+    hotkey_picker_2.setHotkey(Qt.Key.Key_F3)
+
+    with qtbot.waitSignal(sync_2.keymapReloaded) as blocker:
+        sync_2.reload()
+    assert blocker.args == [{'save': Qt.Key.Key_F2, 'open': Qt.Key.Key_F3}]
+
+    # Nothing new since the last offset
+    with qtbot.assertNotEmitted(sync_2.keymapReloaded):
+        sync_2.reload()
+
+
+def test_initial_load_and_compact(qtbot, tmp_path):
+    """Test applying existing hotkeys to new pickers and compacting the file"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    hotkey_picker_1 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    sync_1.addPicker('save', hotkey_picker_1)
+    for key in [Qt.Key.Key_F1, Qt.Key.Key_F2, Qt.Key.Key_F3]:
+        hotkey_picker_1.setHotkey(key)
+
+    sync_1.compact()
+    lines = (tmp_path / 'keymap').read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith('#')
+
+    sync_2 = KeymapSync(path)
+    assert sync_2.getKeymap() == {'save': Qt.Key.Key_F3}
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_2)
+    sync_2.addPicker('save', hotkey_picker_2)
+    assert hotkey_picker_2.getHotkey() == Qt.Key.Key_F3
+
+    # Removed pickers are no longer synced
+    sync_2.removePicker('save')
+    hotkey_picker_2.setHotkey(Qt.Key.Key_F4)
+    sync_1.reload()
+    assert hotkey_picker_1.getHotkey() == Qt.Key.Key_F3
+
+
+def test_compact_with_lagging_reader(qtbot, tmp_path):
+    """Test that an instance that is behind notices a compaction and reads the new file from the start"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    sync_2 = KeymapSync(path)
+    hotkey_pickers_1 = {}
+    hotkey_pickers_2 = {}
+    for action in ['a', 'b'] + ['action {}'.format(i) for i in range(8)]:
+        hotkey_pickers_1[action] = HotkeyPicker()
+        hotkey_pickers_2[action] = HotkeyPicker()
+        qtbot.addWidget(hotkey_pickers_1[action])
+        qtbot.addWidget(hotkey_pickers_2[action])
+        sync_1.addPicker(action, hotkey_pickers_1[action])
+        sync_2.addPicker(action, hotkey_pickers_2[action])
+
+    hotkey_pickers_1['a'].setHotkey(Qt.Key.Key_F1)
+    hotkey_pickers_1['b'].setHotkey(Qt.Key.Key_F2)
+    sync_2.reload()
+    assert hotkey_pickers_2['a'].getHotkey() == Qt.Key.Key_F1
+
+    # Compacted file is longer than the offset of the lagging instance
+    hotkey_pickers_1['a'].setHotkey(Qt.Key.Key_Q)
+    for i in range(8):
+        hotkey_pickers_1['action {}'.format(i)].setHotkey(Qt.Key.Key_A + i)
+    sync_1.compact()
+    assert (tmp_path / 'keymap').stat().st_size > 2 * 40
+
+    sync_2.reload()
+    assert hotkey_pickers_2['a'].getHotkey() == Qt.Key.Key_Q
+    assert hotkey_pickers_2['b'].getHotkey() == Qt.Key.Key_F2
+    assert hotkey_pickers_2['action 7'].getHotkey() == Qt.Key.Key_A + 7
+
+    # Changes appended after the compaction are still picked up
+    hotkey_pickers_1['b'].setHotkey(Qt.Key.Key_F3)
+    sync_2.reload()
+    assert hotkey_pickers_2['b'].getHotkey() == Qt.Key.Key_F3
+
+    # Changes made by the lagging instance reach the compacting instance
+    hotkey_pickers_2['a'].setHotkey(Qt.Key.Key_W)
+    sync_1.reload()
+    assert hotkey_pickers_1['a'].getHotkey() == Qt.Key.Key_W
+
+
+def test_synced_changes_emit_hotkey_changed(qtbot, tmp_path):
+    """Test that synced changes reach the hotkeyChanged handlers of the app without being written back"""
+
+    path = str(tmp_path / 'keymap')
+    sync_1 = KeymapSync(path)
+    sync_2 = KeymapSync(path)
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    sync_1.addPicker('save', hotkey_picker_1)
+    sync_2.addPicker('save', hotkey_picker_2)
+
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F5)
+    size = (tmp_path / 'keymap').stat().st_size
+    with qtbot.waitSignal(hotkey_picker_2.hotkeyChanged) as blocker:
+        sync_2.reload()
+    assert blocker.args == [Qt.Key.Key_F5, 'F5']
+    assert (tmp_path / 'keymap').stat().st_size == size
+
+    # Signal block set by the caller is left untouched
+    hotkey_picker_2.blockSignals(True)
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F6)
+    sync_2.reload()
+    assert hotkey_picker_2.signalsBlocked()
+    assert hotkey_picker_2.getHotkey() == Qt.Key.Key_F6
+
+
+def test_invalid_action_name(qtbot, tmp_path):
+    """Test that action names that would break the file format are rejected"""
+
+    sync = KeymapSync(str(tmp_path / 'keymap'))
+    hotkey_picker = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker)
+
+    for action in ['save\tfile', 'save\nfile', 'save\rfile']:
+        with pytest.raises(ValueError):
+            sync.addPicker(action, hotkey_picker)
+
+
+@pytest.mark.parametrize('compacting_instance', [None, 0, 1])
+def test_interleaved_writes(qtbot, tmp_path, compacting_instance):
+    """Test that instances agree on the latest write when they change the same action before reloading"""
+
+    path = str(tmp_path / 'keymap')
+    syncs = [KeymapSync(path), KeymapSync(path)]
+    hotkey_pickers = [HotkeyPicker(), HotkeyPicker()]
+    for sync, hotkey_picker in zip(syncs, hotkey_pickers):
+        qtbot.addWidget(hotkey_picker)
+        sync.addPicker('save', hotkey_picker)
+
+    # Second instance writes last without having read the change of the first instance
+    hotkey_pickers[0].setHotkey(Qt.Key.Key_F2)
+    hotkey_pickers[1].setHotkey(Qt.Key.Key_F1)
+
+    if compacting_instance is not None:
+        syncs[compacting_instance].compact()
+    for sync in syncs:
+        sync.reload()
+
+    for sync, hotkey_picker in zip(syncs, hotkey_pickers):
+        assert hotkey_picker.getHotkey() == Qt.Key.Key_F1
+        assert sync.getKeymap() == {'save': Qt.Key.Key_F1}
+    assert KeymapSync(path).getKeymap() == {'save': Qt.Key.Key_F1}
+
+
+def test_replace_picker(qtbot, tmp_path):
+    """Test that adding a picker for a registered action disconnects the previous picker"""
+
+    path = str(tmp_path / 'keymap')
+    sync = KeymapSync(path)
+    hotkey_picker_1 = HotkeyPicker()
+    hotkey_picker_2 = HotkeyPicker()
+    qtbot.addWidget(hotkey_picker_1)
+    qtbot.addWidget(hotkey_picker_2)
+    sync.addPicker('save', hotkey_picker_1)
+    sync.addPicker('save', hotkey_picker_2)
+
+    hotkey_picker_1.setHotkey(Qt.Key.Key_F1)
+    assert sync.getKeymap() == {}
+    hotkey_picker_2.setHotkey(Qt.Key.Key_F2)
+    assert sync.getKeymap() == {'save': Qt.Key.Key_F2}
+
+    sync.removePicker('save')
+    hotkey_picker_2.setHotkey(Qt.Key.Key_F3)
+    assert KeymapSync(path).getKeymap() == {'save': Qt.Key.Key_F2}
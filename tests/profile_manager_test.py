@@ -0,0 +1,161 @@
+import time
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget
+from src.pyqthotkey import HotkeyPicker, ProfileManager
+
+
+def create_profile_manager(qtbot, actions):
+    """Create a profile manager with a hotkey picker for every action"""
+
+    profile_manager = ProfileManager()
+    hotkey_pickers = {}
+    for action in actions:
+        hotkey_picker = HotkeyPicker()
+        qtbot.addWidget(hotkey_picker)
+        profile_manager.addPicker(action, hotkey_picker)
+        hotkey_pickers[action] = hotkey_picker
+    return profile_manager, hotkey_pickers
+
+
+def test_switch_profile(qtbot):
+    """Test switching between profiles"""
+
+    profile_manager, hotkey_pickers = create_profile_manager(qtbot, ['save', 'open', 'close'])
+    profile_manager.addProfile('editing', {'save': Qt.Key.Key_F1, 'open': Qt.Key.Key_F2})
+    profile_manager.addProfile('review', {'save': Qt.Key.Key_F1, 'close': Qt.Key.Key_F3})
+    assert profile_manager.getProfileNames() == ['editing', 'review']
+    assert profile_manager.getCurrentProfile() is None
+
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        assert profile_manager.switchProfile('editing')
+    assert blocker.args == ['editing', ['save', 'open'], []]
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_F1
+    assert hotkey_pickers['open'].getHotkey() == Qt.Key.Key_F2
+    assert hotkey_pickers['close'].getHotkey() is None
+
+    # Only the changed pickers are updated and no per-picker signal is emitted
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        with qtbot.assertNotEmitted(hotkey_pickers['open'].hotkeyChanged):
+            profile_manager.switchProfile('review')
+    assert blocker.args == ['review', ['open', 'close'], []]
+    assert hotkey_pickers['open'].getHotkey() is None
+    assert hotkey_pickers['open'].text() == hotkey_pickers['open'].getDefaultText()
+    assert hotkey_pickers['close'].getHotkey() == Qt.Key.Key_F3
+    assert hotkey_pickers['close'].text() == 'F3'
+    assert profile_manager.getCurrentProfile() == 'review'
+
+    assert not profile_manager.switchProfile('missing')
+
+
+def test_edit_current_profile(qtbot):
+    """Test that changing a picker updates the current profile"""
+
+    profile_manager, hotkey_pickers = create_profile_manager(qtbot, ['save', 'open'])
+    profile_manager.addProfile('editing', {'save': Qt.Key.Key_F1})
+    profile_manager.addProfile('review', {'save': Qt.Key.Key_F1})
+    profile_manager.switchProfile('editing')
+
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('review')
+    assert blocker.args == ['review', [], []]
+
+    hotkey_pickers['open'].setHotkey(Qt.Key.Key_A)
+    assert profile_manager.getProfile('review') == {'save': Qt.Key.Key_F1, 'open': Qt.Key.Key_A}
+
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('editing')
+    assert blocker.args == ['editing', ['open'], []]
+    assert hotkey_pickers['open'].getHotkey() is None
+
+
+def test_save_and_remove_profile(qtbot):
+    """Test saving the current hotkeys as a profile and removing profiles"""
+
+    profile_manager, hotkey_pickers = create_profile_manager(qtbot, ['save', 'open'])
+    hotkey_pickers['save'].setHotkey(Qt.Key.Key_S)
+    profile_manager.saveProfile('default')
+    assert profile_manager.getProfile('default') == {'save': Qt.Key.Key_S, 'open': None}
+
+    profile_manager.addProfile('empty', {})
+    profile_manager.switchProfile('empty')
+    assert hotkey_pickers['save'].getHotkey() is None
+    profile_manager.switchProfile('default')
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_S
+
+    profile_manager.removeProfile('default')
+    assert profile_manager.getProfile('default') is None
+    assert profile_manager.getCurrentProfile() is None
+    assert profile_manager.getProfileNames() == ['empty']
+
+
+def test_key_filter(qtbot):
+    """Test switching to a profile with a key that is rejected by the key filter"""
+
+    profile_manager, hotkey_pickers = create_profile_manager(qtbot, ['save'])
+    hotkey_pickers['save'].setKeyFilterEnabled(True)
+    hotkey_pickers['save'].setBlacklistedKeys([Qt.Key.Key_F1])
+    hotkey_pickers['save'].setHotkey(Qt.Key.Key_F2)
+
+    profile_manager.addProfile('editing', {'save': Qt.Key.Key_F1})
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('editing')
+    assert blocker.args == ['editing', [], ['save']]
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_F2
+
+    # Profile keeps the rejected key and applies it once the filter allows it
+    assert profile_manager.getProfile('editing') == {'save': Qt.Key.Key_F1}
+    hotkey_pickers['save'].setKeyFilterEnabled(False)
+    profile_manager.switchProfile('editing')
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_F1
+
+
+def test_picker_changed_with_blocked_signals(qtbot):
+    """Test switching after a picker has been changed without the manager being notified"""
+
+    profile_manager, hotkey_pickers = create_profile_manager(qtbot, ['save', 'open'])
+    profile_manager.addProfile('editing', {'save': Qt.Key.Key_F1})
+    profile_manager.addProfile('review', {'save': Qt.Key.Key_F1, 'open': Qt.Key.Key_F2})
+    profile_manager.switchProfile('editing')
+
+    hotkey_pickers['save'].blockSignals(True)
+    hotkey_pickers['save'].setHotkey(Qt.Key.Key_F9)
+
+    # Cached diff is used until the pickers are refreshed
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('review')
+    assert blocker.args == ['review', ['open'], []]
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_F9
+
+    profile_manager.switchProfile('editing')
+    profile_manager.refresh()
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('review')
+    assert blocker.args == ['review', ['save', 'open'], []]
+    assert hotkey_pickers['save'].getHotkey() == Qt.Key.Key_F1
+
+    # Signal block set by the caller is left untouched
+    assert hotkey_pickers['save'].signalsBlocked()
+
+
+def test_switch_many_bindings(qtbot):
+    """Test switching between profiles with 5,000 bindings"""
+
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    profile_manager = ProfileManager()
+    for i in range(5000):
+        profile_manager.addPicker(str(i), HotkeyPicker(widget))
+    profile_manager.addProfile('editing', {str(i): Qt.Key.Key_A for i in range(5000)})
+    profile_manager.addProfile('review', {str(i): Qt.Key.Key_A if i % 2 else Qt.Key.Key_B for i in range(5000)})
+    profile_manager.switchProfile('editing')
+
+    # Switching to the current profile uses the cached diff without reading the pickers
+    with qtbot.waitSignal(profile_manager.profileSwitched) as blocker:
+        profile_manager.switchProfile('editing')
+    assert blocker.args == ['editing', [], []]
+
+    # Loose bound that catches regressions without depending on the speed of the machine
+    start = time.perf_counter()
+    profile_manager.switchProfile('review')
+    profile_manager.switchProfile('editing')
+    assert time.perf_counter() - start < 0.5
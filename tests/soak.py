@@ -0,0 +1,260 @@
+"""Soak test for the hotkey picker
+
+Fires randomized focus changes, key presses, cancel keys, filter changes,
+setHotkey() / reset() and setKeyName() calls at a large number of hotkey pickers,
+checks the state invariants after every step and reports throughput,
+latency percentiles and memory growth (traced Python memory and RSS) per window of steps.
+
+Run it from the main directory with:
+    python -m tests.soak --pickers 100 --steps 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtGui import QFocusEvent, QKeyEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+from src.pyqthotkey import HotkeyPicker
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# Keys the soak test presses and binds
+KEYS = ([getattr(Qt.Key, 'Key_F{}'.format(i)) for i in range(1, 13)]
+        + [getattr(Qt.Key, 'Key_{}'.format(chr(c))) for c in range(ord('A'), ord('Z') + 1)]
+        + [Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Space,
+           Qt.Key.Key_Return, Qt.Key.Key_Tab, Qt.Key.Key_Escape, Qt.Key.Key_Delete])
+
+# Relative frequency of every operation
+OPERATIONS = {
+    'focus_in': 20,
+    'focus_out': 15,
+    'key_press': 30,
+    'cancel': 5,
+    'filter': 5,
+    'set_hotkey': 15,
+    'reset': 5,
+    'set_key_name': 5
+}
+
+
+def check_invariants(hotkey_picker: HotkeyPicker) -> str | None:
+    """Check that the state of a hotkey picker is consistent
+
+    :param hotkey_picker: the hotkey picker to check
+    :return: description of the violated invariant, None if the state is consistent
+    """
+
+    hotkey = hotkey_picker.getHotkey()
+
+    if hotkey_picker.getHotkeyName() != HotkeyPicker.getKeyName(hotkey):
+        return 'getHotkeyName() does not match getHotkey() ({})'.format(hotkey)
+
+    if hotkey_picker.isInSelection():
+        expected_text = hotkey_picker.getSelectionText()
+    elif hotkey is None:
+        expected_text = hotkey_picker.getDefaultText()
+    else:
+        expected_text = HotkeyPicker.getKeyName(hotkey)
+
+    if hotkey_picker.text() != expected_text:
+        return 'text is {!r} but should be {!r} (hotkey: {}, in selection: {})'.format(
+            hotkey_picker.text(), expected_text, hotkey, hotkey_picker.isInSelection())
+
+    return None
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Get a percentile of a sorted list of values
+
+    :param sorted_values: the values in ascending order
+    :param fraction: the percentile between 0 and 1 (e.g. 0.99)
+    :return: the value at the percentile
+    """
+
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def get_rss_kb() -> float | None:
+    """Get the resident set size of the process
+
+    Reads the current RSS from /proc on Linux and falls back to the peak RSS from getrusage().
+
+    :return: RSS in kB, None if it cannot be read on this platform
+    """
+
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if resource is None:
+        return None
+
+    # ru_maxrss is in bytes on macOS and in kB elsewhere
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 if sys.platform == 'darwin' else float(max_rss)
+
+
+def run_soak(picker_count: int = 50, steps: int = 100000, window: int = 10000,
+             seed: int | None = None, trace_memory: bool = True) -> dict:
+    """Run the soak test (a QApplication must already exist)
+
+    :param picker_count: number of hotkey pickers
+    :param steps: number of randomized operations
+    :param window: number of steps per reported window
+    :param seed: seed for the random operations (random if None)
+    :param trace_memory: if the Python memory growth should be traced (slows down the test)
+    :return: dict with the seed, the stats of every window and the invariant violations
+    """
+
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = random.Random(seed)
+
+    operations = list(OPERATIONS.keys())
+    weights = list(OPERATIONS.values())
+    original_key_names = {key: HotkeyPicker.getKeyName(key) for key in KEYS}
+
+    container = QWidget()
+    hotkey_pickers = [HotkeyPicker(container) for _ in range(picker_count)]
+    windows = []
+    violations = []
+    latencies = []
+
+    if trace_memory:
+        tracemalloc.start()
+        memory_start = tracemalloc.get_traced_memory()[0]
+    rss_start = get_rss_kb()
+    window_start = time.perf_counter()
+
+    try:
+        for step in range(1, steps + 1):
+            hotkey_picker = rng.choice(hotkey_pickers)
+            operation = rng.choices(operations, weights)[0]
+
+            start = time.perf_counter()
+            run_operation(rng, operation, hotkey_picker, hotkey_pickers)
+            latencies.append(time.perf_counter() - start)
+
+            violation = check_invariants(hotkey_picker)
+            if violation is not None:
+                violations.append({'step': step, 'operation': operation, 'violation': violation})
+
+            if step % window == 0 or step == steps:
+                # Every picker is checked at the end of a window
+                for i, other_hotkey_picker in enumerate(hotkey_pickers):
+                    violation = check_invariants(other_hotkey_picker)
+                    if violation is not None:
+                        violations.append({'step': step, 'operation': 'picker {}'.format(i),
+                                           'violation': violation})
+
+                elapsed = time.perf_counter() - window_start
+                latencies.sort()
+                windows.append({
+                    'step': step,
+                    'steps_per_second': len(latencies) / elapsed if elapsed else 0.0,
+                    'p50_us': percentile(latencies, 0.5) * 1e6,
+                    'p95_us': percentile(latencies, 0.95) * 1e6,
+                    'p99_us': percentile(latencies, 0.99) * 1e6,
+                    'max_us': latencies[-1] * 1e6,
+                    'memory_growth_kb': ((tracemalloc.get_traced_memory()[0] - memory_start) / 1024
+                                         if trace_memory else None),
+                    'rss_growth_kb': None if rss_start is None else get_rss_kb() - rss_start
+                })
+                latencies = []
+                window_start = time.perf_counter()
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        for key, name in original_key_names.items():
+            HotkeyPicker.setKeyName(key, name)
+        container.deleteLater()
+
+    return {'seed': seed, 'windows': windows, 'violations': violations}
+
+
+def run_operation(rng: random.Random, operation: str, hotkey_picker: HotkeyPicker,
+                  hotkey_pickers: list[HotkeyPicker]):
+    """Run a single randomized operation on a hotkey picker
+
+    :param rng: the random number generator
+    :param operation: name of the operation (one of OPERATIONS)
+    :param hotkey_picker: the hotkey picker to run the operation on
+    :param hotkey_pickers: all hotkey pickers of the soak test
+    """
+
+    if operation == 'focus_in':
+        QApplication.sendEvent(hotkey_picker, QFocusEvent(QEvent.Type.FocusIn))
+    elif operation == 'focus_out':
+        QApplication.sendEvent(hotkey_picker, QFocusEvent(QEvent.Type.FocusOut))
+    elif operation == 'key_press':
+        key_event = QKeyEvent(QEvent.Type.KeyPress, rng.choice(KEYS), Qt.KeyboardModifier.NoModifier)
+        QApplication.sendEvent(hotkey_picker, key_event)
+    elif operation == 'cancel':
+        key_event = QKeyEvent(QEvent.Type.KeyPress, hotkey_picker.getCancelKey(),
+                              Qt.KeyboardModifier.NoModifier)
+        QApplication.sendEvent(hotkey_picker, key_event)
+    elif operation == 'filter':
+        choice = rng.randrange(4)
+        if choice == 0:
+            hotkey_picker.setKeyFilterEnabled(not hotkey_picker.isKeyFilterEnabled())
+        elif choice == 1:
+            hotkey_picker.setWhitelistedKeys(rng.sample(KEYS, rng.randrange(len(KEYS))))
+        elif choice == 2:
+            hotkey_picker.setBlacklistedKeys(rng.sample(KEYS, rng.randrange(len(KEYS))))
+        else:
+            hotkey_picker.setCancelKey(rng.choice(KEYS))
+    elif operation == 'set_hotkey':
+        hotkey_picker.setHotkey(rng.choice(KEYS))
+    elif operation == 'reset':
+        hotkey_picker.reset()
+    elif operation == 'set_key_name':
+        # Keys selected by other pickers are renamed too, their text is checked at the end of the window
+        HotkeyPicker.setKeyName(rng.choice(KEYS), 'Key {}'.format(rng.randrange(1000)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Soak test for the hotkey picker')
+    parser.add_argument('--pickers', type=int, default=50, help='number of hotkey pickers')
+    parser.add_argument('--steps', type=int, default=100000, help='number of randomized operations')
+    parser.add_argument('--window', type=int, default=10000, help='number of steps per reported window')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the random operations')
+    parser.add_argument('--no-memory', action='store_true', help='disable tracing the memory growth')
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication([])
+
+    report = run_soak(args.pickers, args.steps, args.window, args.seed, not args.no_memory)
+
+    print('Seed: {}'.format(report['seed']))
+    print('{:>10} {:>12} {:>10} {:>10} {:>10} {:>10} {:>14} {:>14}'.format(
+        'step', 'steps/s', 'p50 us', 'p95 us', 'p99 us', 'max us', 'memory kB', 'RSS kB'))
+    for stats in report['windows']:
+        memory = '-' if stats['memory_growth_kb'] is None else '{:.1f}'.format(stats['memory_growth_kb'])
+        rss = '-' if stats['rss_growth_kb'] is None else '{:.1f}'.format(stats['rss_growth_kb'])
+        print('{:>10} {:>12.0f} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>14} {:>14}'.format(
+            stats['step'], stats['steps_per_second'], stats['p50_us'], stats['p95_us'],
+            stats['p99_us'], stats['max_us'], memory, rss))
+
+    print('Invariant violations: {}'.format(len(report['violations'])))
+    for violation in report['violations'][:20]:
+        print('  step {step} ({operation}): {violation}'.format(**violation))
+
+    app.quit()
+    return 1 if report['violations'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,17 @@
+from tests.soak import run_soak
+
+
+def test_soak(qtbot):
+    """Test a short soak run with randomized operations on many hotkey pickers"""
+
+    report = run_soak(picker_count=20, steps=5000, window=1000, seed=0)
+
+    assert report['violations'] == []
+    assert len(report['windows']) == 5
+    assert all(stats['steps_per_second'] > 0 for stats in report['windows'])
+
+    # Memory grows during the first window (e.g. latency list and caches) but not after it
+    first, last = report['windows'][0], report['windows'][-1]
+    assert last['memory_growth_kb'] - first['memory_growth_kb'] < 64
+    if first['rss_growth_kb'] is not None:
+        assert last['rss_growth_kb'] - first['rss_growth_kb'] < 8 * 1024